@@ -14,19 +14,21 @@ To run this example:
 """
 
 import asyncio
-import os
+import sys
+import time
 from supabase_lib_rs import Client, SupabaseError
 
+from concurrency import gather_bounded, with_eager_tasks
+from config import SETTINGS
 
+
+@with_eager_tasks
 async def main():
     print("=== Supabase Python Client (Rust-Powered) Example ===\n")
 
     # Initialize client
-    url = os.getenv("SUPABASE_URL", "http://localhost:54321")
-    key = os.getenv("SUPABASE_KEY", "your-anon-key")
-
     try:
-        client = Client(url, key)
+        client = Client(SETTINGS.url, SETTINGS.key)
         print("✅ Client initialized successfully")
     except SupabaseError as e:
         print(f"❌ Failed to create client: {e}")
@@ -107,26 +109,31 @@ async def main():
     # Performance demonstration
     print("\n🚀 Performance Test:")
 
-    start_time = asyncio.get_event_loop().time()
+    # Collect output and write it once after the timed calls
+    log_buf = []
+    start_time = time.perf_counter()
 
     # Run multiple operations concurrently
-    tasks = [
-        client.database.from_("profiles").select("id").execute(),
-        client.storage.list_buckets(),
-        client.functions.invoke("ping", {}),
+    calls = [
+        lambda: client.database.from_("profiles").select("id").execute(),
+        lambda: client.storage.list_buckets(),
+        lambda: client.functions.invoke("ping", {}),
     ]
 
     try:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        end_time = asyncio.get_event_loop().time()
+        results = await gather_bounded(calls, return_exceptions=True)
+        end_time = time.perf_counter()
 
         successful = sum(1 for r in results if not isinstance(r, Exception))
         total_time = (end_time - start_time) * 1000  # Convert to milliseconds
 
-        print(f"✅ {successful}/3 operations completed in {total_time:.1f}ms")
-        print("   Rust-powered performance in action! 🦀")
+        log_buf.append(f"✅ {successful}/3 operations completed in {total_time:.1f}ms")
+        log_buf.append("   Rust-powered performance in action! 🦀")
     except Exception as e:
-        print(f"⚠️ Performance test: {e}")
+        log_buf.append(f"⚠️ Performance test: {e}")
+
+    sys.stdout.write("\n".join(log_buf) + "\n")
+    sys.stdout.flush()
 
     print(f"\n🎉 Example completed successfully!")
     print("📚 Key benefits demonstrated:")
@@ -138,14 +145,17 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Check if we're running in an async context
-    try:
-        loop = asyncio.get_running_loop()
+    # Check for an already running event loop without raising RuntimeError
+    if asyncio._get_running_loop() is not None:
         print("Running in existing event loop...")
-        # If we're in a Jupyter notebook or similar
+        # If we're in a Jupyter notebook or similar, allow a nested asyncio.run()
         import nest_asyncio
         nest_asyncio.apply()
-        await main()
-    except RuntimeError:
-        # Normal script execution
-        asyncio.run(main())
+    else:
+        # Normal script execution, on uvloop when it is installed
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+Concurrency helpers shared by the examples
+
+Supabase connection poolers cap the number of client connections, so
+unbounded `asyncio.gather` over many queries can stall with
+"Max client connections reached". `gather_bounded` keeps at most
+`SUPABASE_MAX_CONCURRENCY` operations (default 10) in flight.
+
+The client's methods block until the response arrives, so `gather_bounded`
+takes zero-argument callables and runs each one in a worker thread; the
+Rust side releases the GIL while it waits on the network.
+
+`with_eager_tasks` enables eager task execution on Python 3.12+ while the
+decorated coroutine runs. Tasks then start as soon as they are created, so
+`gather_bounded` hands its first `n` calls to the executor before it first
+yields instead of one loop iteration later. That is the whole saving: the
+blocking calls themselves take just as long. The loop's previous task
+factory is restored afterwards, which matters on loops the script does not
+own (e.g. Jupyter).
+"""
+
+import asyncio
+import functools
+
+from config import SETTINGS
+
+MAX_CONCURRENCY = SETTINGS.max_concurrency
+
+
+async def gather_bounded(calls, n=MAX_CONCURRENCY, return_exceptions=False):
+    """Like `asyncio.gather` for blocking callables, at most `n` at a time"""
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(n)
+
+    async def runner(call):
+        async with sem:
+            return await loop.run_in_executor(None, call)
+
+    return await asyncio.gather(
+        *(runner(c) for c in calls),
+        return_exceptions=return_exceptions,
+    )
+
+
+def with_eager_tasks(coro_fn):
+    """Run `coro_fn` with eager task execution (Python 3.12+, no-op before)"""
+    @functools.wraps(coro_fn)
+    async def wrapper(*args, **kwargs):
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            return await coro_fn(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        previous_factory = loop.get_task_factory()
+        loop.set_task_factory(eager_task_factory)
+        try:
+            return await coro_fn(*args, **kwargs)
+        finally:
+            loop.set_task_factory(previous_factory)
+
+    return wrapper
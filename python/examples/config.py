@@ -0,0 +1,21 @@
+"""
+Example settings, read from the environment once at import time
+
+Environment variables:
+    SUPABASE_URL: Supabase project URL (default: local development stack)
+    SUPABASE_KEY: Supabase API key
+    SUPABASE_MAX_CONCURRENCY: Maximum concurrent requests (default: 10)
+"""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Settings:
+    url: str = os.getenv("SUPABASE_URL", "http://localhost:54321")
+    key: str = os.getenv("SUPABASE_KEY", "your-anon-key")
+    max_concurrency: int = int(os.getenv("SUPABASE_MAX_CONCURRENCY", "10"))
+
+
+SETTINGS = Settings()
@@ -14,19 +14,48 @@ To run this example:
 """
 
 import asyncio
-import os
-from datetime import datetime, timedelta
+import functools
+import sys
+import time
+from datetime import datetime, timedelta, timezone
 from supabase_lib_rs import Client, SupabaseError
 
+from concurrency import gather_bounded, with_eager_tasks
+from config import SETTINGS
 
+# Row counts are cached per table for this many seconds
+COUNT_TTL_SECONDS = 60
+
+
+@functools.lru_cache(maxsize=128)
+def _count(client, table, bucket):
+    """Row count for `table`; `bucket` only keys the cache by time window"""
+    rows = client.database.from_(table).select("count").execute()
+    return rows[0]["count"] if rows else 0
+
+
+def cached_count(client, table):
+    """Row count for `table`, refreshed at most once per TTL bucket"""
+    return _count(client, table, int(time.monotonic() // COUNT_TTL_SECONDS))
+
+
+def build_batch(count, author_id):
+    """Build `count` post rows for a single batch insert"""
+    return [
+        {"title": f"Batch Post {i}", "content": f"Content {i}", "author_id": author_id}
+        for i in range(1, count + 1)
+    ]
+
+
+@with_eager_tasks
 async def main():
     print("=== Advanced Database Operations Example ===\n")
 
     # Initialize client
-    client = Client(
-        os.getenv("SUPABASE_URL", "http://localhost:54321"),
-        os.getenv("SUPABASE_KEY", "your-anon-key")
-    )
+    client = Client(SETTINGS.url, SETTINGS.key)
+
+    # Timestamp for "recent" filters, computed once per run
+    week_ago_iso = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
 
     print("🗄️ Demonstrating advanced database operations...\n")
 
@@ -49,12 +78,28 @@ async def main():
         recent_posts = await client.database.from_("posts") \
             .select("id, title, created_at, published") \
             .filter("published", "eq", True) \
-            .filter("created_at", "gte", (datetime.now() - timedelta(days=7)).isoformat()) \
+            .filter("created_at", "gte", week_ago_iso) \
             .order("created_at", desc=True) \
             .limit(10) \
             .execute()
         print(f"✅ Found {len(recent_posts)} recent published posts")
 
+        # Next page: keyset pagination seeks past the last seen created_at
+        # through the index instead of scanning and discarding an offset.
+        # Rows sharing the boundary created_at are skipped, so this pages
+        # exactly only when created_at is unique
+        if recent_posts:
+            last_cursor = recent_posts[-1]["created_at"]
+            next_page = await client.database.from_("posts") \
+                .select("id, title, created_at, published") \
+                .filter("published", "eq", True) \
+                .filter("created_at", "gte", week_ago_iso) \
+                .filter("created_at", "lt", last_cursor) \
+                .order("created_at", desc=True) \
+                .limit(10) \
+                .execute()
+            print(f"✅ Next page returned {len(next_page)} posts")
+
         # Update
         if recent_posts:
             post_id = recent_posts[0]["id"]
@@ -124,11 +169,9 @@ async def main():
         # 4. Aggregation and statistics
         print("\n4️⃣ Aggregation Operations:")
 
-        # Count operations
-        total_posts = await client.database.from_("posts") \
-            .select("count") \
-            .execute()
-        print(f"✅ Total posts count: {total_posts[0]['count'] if total_posts else 0}")
+        # Count operations (cached)
+        total_posts = cached_count(client, "posts")
+        print(f"✅ Total posts count: {total_posts}")
 
         # Group by operations
         stats_by_author = await client.database.from_("posts") \
@@ -167,10 +210,7 @@ async def main():
         print("\n6️⃣ Batch Operations:")
 
         # Batch insert
-        batch_data = [
-            {"title": f"Batch Post {i}", "content": f"Content {i}", "author_id": 1}
-            for i in range(1, 6)
-        ]
+        batch_data = build_batch(5, author_id=1)
 
         batch_result = await client.database.from_("posts") \
             .insert(batch_data) \
@@ -190,25 +230,30 @@ async def main():
     # 7. Performance metrics
     print("\n7️⃣ Performance Comparison:")
 
-    start_time = asyncio.get_event_loop().time()
+    # Collect output and write it once after the timed calls
+    log_buf = []
+    start_time = time.perf_counter()
 
     # Concurrent queries
-    concurrent_tasks = [
-        client.database.from_("posts").select("id").limit(100).execute(),
-        client.database.from_("profiles").select("id").limit(50).execute(),
-        client.database.from_("posts").select("count").execute(),
+    concurrent_calls = [
+        lambda: client.database.from_("posts").select("id").limit(100).execute(),
+        lambda: client.database.from_("profiles").select("id").limit(50).execute(),
+        lambda: client.database.from_("posts").select("count").execute(),
     ]
 
     try:
-        results = await asyncio.gather(*concurrent_tasks)
-        end_time = asyncio.get_event_loop().time()
+        results = await gather_bounded(concurrent_calls)
+        end_time = time.perf_counter()
 
         total_time = (end_time - start_time) * 1000
-        print(f"✅ 3 concurrent queries completed in {total_time:.1f}ms")
-        print("   🚀 Rust-powered performance advantage!")
+        log_buf.append(f"✅ 3 concurrent queries completed in {total_time:.1f}ms")
+        log_buf.append("   🚀 Rust-powered performance advantage!")
 
     except Exception as e:
-        print(f"❌ Performance test failed: {e}")
+        log_buf.append(f"❌ Performance test failed: {e}")
+
+    sys.stdout.write("\n".join(log_buf) + "\n")
+    sys.stdout.flush()
 
     print(f"\n🎉 Advanced database operations completed!")
     print("📊 Operations demonstrated:")
@@ -221,4 +266,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
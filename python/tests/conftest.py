@@ -0,0 +1,56 @@
+"""
+Shared pytest fixtures for Supabase Python client tests
+"""
+
+import asyncio
+import os
+
+import pytest
+from supabase_lib_rs import Client
+
+MAX_CONCURRENCY = int(os.getenv("SUPABASE_MAX_CONCURRENCY", "10"))
+
+
+async def _gather_bounded(calls, n=MAX_CONCURRENCY):
+    """Run blocking callables in worker threads, at most `n` at a time
+
+    Returns each call's result, or the exception it raised, in order.
+    Exceptions are caught per task, so `asyncio.gather` stays on its plain
+    result path instead of `return_exceptions=True`.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(n)
+
+    async def runner(call):
+        async with sem:
+            try:
+                return await loop.run_in_executor(None, call)
+            except Exception as e:
+                return e
+
+    return await asyncio.gather(*(runner(c) for c in calls))
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Single client shared by the whole test session"""
+    return Client(
+        os.getenv("SUPABASE_URL", "http://localhost:54321"),
+        os.getenv("SUPABASE_KEY", "test-key"),
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed"""
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def gather_bounded():
+    """Bounded gather helper for blocking client calls"""
+    return _gather_bounded
@@ -297,6 +297,8 @@ impl Client {
         let client = HttpClient::builder()
             .timeout(Duration::from_secs(config.http_config.timeout))
             .connect_timeout(Duration::from_secs(config.http_config.connect_timeout))
+            // Keep pooled connections (HTTP/2 via ALPN when offered) alive between requests
+            .tcp_keepalive(Duration::from_secs(60))
             .redirect(reqwest::redirect::Policy::limited(
                 config.http_config.max_redirects,
             ))
@@ -2,12 +2,13 @@
 
 use crate::{
     error::{Error, Result},
-    types::{FilterOperator, JsonValue, OrderDirection, SupabaseConfig},
+    types::{CountMethod, FilterOperator, JsonValue, OrderDirection, SupabaseConfig},
 };
+use bytes::Bytes;
 use reqwest::Client as HttpClient;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
-use std::{collections::HashMap, sync::Arc};
+use std::sync::Arc;
 use tracing::{debug, info};
 use url::Url;
 
@@ -30,6 +31,7 @@ pub struct QueryBuilder {
     offset: Option<u32>,
     single: bool,
     joins: Vec<Join>,
+    count: Option<CountMethod>,
 }
 
 /// Represents a table join operation
@@ -565,8 +567,11 @@ impl Database {
     }
 
     /// Build query parameters from filters
-    fn build_query_params(&self, filters: &[Filter]) -> HashMap<String, String> {
-        let mut params = HashMap::new();
+    ///
+    /// Parameters are kept as an ordered list rather than a map, so several
+    /// filters on the same column (e.g. a range) are all sent.
+    fn build_query_params(&self, filters: &[Filter]) -> Vec<(String, String)> {
+        let mut params = Vec::new();
 
         for filter in filters {
             self.build_filter_params(filter, &mut params);
@@ -576,7 +581,7 @@ impl Database {
     }
 
     /// Build parameters for a single filter (recursive for logical operators)
-    fn build_filter_params(&self, filter: &Filter, params: &mut HashMap<String, String>) {
+    fn build_filter_params(&self, filter: &Filter, params: &mut Vec<(String, String)>) {
         match filter {
             Filter::Simple {
                 column,
@@ -603,7 +608,7 @@ impl Database {
                     FilterOperator::Adjacent => format!("adj.{}", value),
                 };
 
-                params.insert(column.clone(), filter_value);
+                params.push((column.clone(), filter_value));
             }
             Filter::And(filters) => {
                 // AND is the default behavior in PostgREST - just add all filters
@@ -620,7 +625,7 @@ impl Database {
 
                 if !or_conditions.is_empty() {
                     let or_value = format!("({})", or_conditions.join(","));
-                    params.insert("or".to_string(), or_value);
+                    params.push(("or".to_string(), or_value));
                 }
             }
             Filter::Not(filter) => {
@@ -651,7 +656,7 @@ impl Database {
                             FilterOperator::Adjacent => format!("adj.{}", value),
                         };
 
-                        params.insert(format!("not.{}", column), filter_value);
+                        params.push((format!("not.{}", column), filter_value));
                     }
                     Filter::And(and_filters) => {
                         // NOT(AND(...)) becomes NOT with multiple conditions
@@ -662,7 +667,7 @@ impl Database {
 
                         if !and_conditions.is_empty() {
                             let not_value = format!("and.({})", and_conditions.join(","));
-                            params.insert("not".to_string(), not_value);
+                            params.push(("not".to_string(), not_value));
                         }
                     }
                     Filter::Or(or_filters) => {
@@ -674,7 +679,7 @@ impl Database {
 
                         if !or_conditions.is_empty() {
                             let not_value = format!("or.({})", or_conditions.join(","));
-                            params.insert("not".to_string(), not_value);
+                            params.push(("not".to_string(), not_value));
                         }
                     }
                     Filter::Not(_) => {
@@ -753,6 +758,7 @@ impl QueryBuilder {
             offset: None,
             single: false,
             joins: Vec::new(),
+            count: None,
         }
     }
 
@@ -891,6 +897,15 @@ impl QueryBuilder {
         self
     }
 
+    /// Request a total row count using the given strategy
+    ///
+    /// The count is returned by [`QueryBuilder::execute_with_count`].
+    /// [`CountMethod::Estimated`] avoids a full table scan on large tables.
+    pub fn count(mut self, method: CountMethod) -> Self {
+        self.count = Some(method);
+        self
+    }
+
     /// Group filters with AND logic
     ///
     /// # Examples
@@ -1150,6 +1165,92 @@ impl QueryBuilder {
     where
         T: for<'de> Deserialize<'de>,
     {
+        Ok(self.execute_with_count().await?.data)
+    }
+
+    /// Execute the query and return the rows together with the total count
+    ///
+    /// The count is only present when requested with [`QueryBuilder::count`]
+    /// and reported by PostgREST in the `Content-Range` header.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// # use supabase_lib_rs::{Client, types::CountMethod};
+    /// # use serde_json::Value;
+    /// # async fn example() -> Result<(), Box<dyn std::error::Error>> {
+    /// let client = Client::new("http://localhost:54321", "test-key").unwrap();
+    ///
+    /// let response = client.database()
+    ///     .from("posts")
+    ///     .select("id")
+    ///     .count(CountMethod::Estimated)
+    ///     .limit(1)
+    ///     .execute_with_count::<Value>()
+    ///     .await?;
+    /// println!("~{:?} posts", response.count);
+    /// # Ok(())
+    /// # }
+    /// ```
+    pub async fn execute_with_count<T>(&self) -> Result<DatabaseResponse<Vec<T>>>
+    where
+        T: for<'de> Deserialize<'de>,
+    {
+        let response = self.send().await?;
+
+        let count = response
+            .headers()
+            .get("Content-Range")
+            .and_then(|value| value.to_str().ok())
+            .and_then(parse_content_range_total);
+
+        let data = if self.single {
+            let single_item: T = response.json().await?;
+            vec![single_item]
+        } else {
+            response.json().await?
+        };
+
+        info!(
+            "SELECT query executed successfully on table: {}",
+            self.table
+        );
+        Ok(DatabaseResponse { data, count })
+    }
+
+    /// Execute the query and return the response body without deserializing it
+    ///
+    /// Useful when the JSON is handed to another parser, or forwarded as is.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// # use supabase_lib_rs::Client;
+    /// # async fn example() -> Result<(), Box<dyn std::error::Error>> {
+    /// let client = Client::new("http://localhost:54321", "test-key").unwrap();
+    ///
+    /// let body = client.database()
+    ///     .from("posts")
+    ///     .select("id, title")
+    ///     .execute_raw()
+    ///     .await?;
+    /// println!("{} bytes of JSON", body.len());
+    /// # Ok(())
+    /// # }
+    /// ```
+    pub async fn execute_raw(&self) -> Result<Bytes> {
+        let response = self.send().await?;
+        let body = response.bytes().await?;
+
+        info!(
+            "SELECT query executed successfully on table: {}",
+            self.table
+        );
+        Ok(body)
+    }
+
+    /// Build and send the SELECT request, failing on a non-success status
+    async fn send(&self) -> Result<reqwest::Response> {
         debug!("Executing SELECT query on table: {}", self.table);
 
         let mut url = Url::parse(&format!("{}/{}", self.database.rest_url(), self.table))?;
@@ -1159,7 +1260,7 @@ impl QueryBuilder {
 
         // Build select statement with joins
         let select_clause = self.build_select_with_joins();
-        query_params.insert("select".to_string(), select_clause);
+        query_params.push(("select".to_string(), select_clause));
 
         if !self.order_by.is_empty() {
             let order_clauses: Vec<String> = self
@@ -1173,15 +1274,15 @@ impl QueryBuilder {
                     format!("{}.{}", order.column, direction)
                 })
                 .collect();
-            query_params.insert("order".to_string(), order_clauses.join(","));
+            query_params.push(("order".to_string(), order_clauses.join(",")));
         }
 
         if let Some(limit) = self.limit {
-            query_params.insert("limit".to_string(), limit.to_string());
+            query_params.push(("limit".to_string(), limit.to_string()));
         }
 
         if let Some(offset) = self.offset {
-            query_params.insert("offset".to_string(), offset.to_string());
+            query_params.push(("offset".to_string(), offset.to_string()));
         }
 
         // Set URL query parameters
@@ -1196,6 +1297,10 @@ impl QueryBuilder {
             request = request.header("Accept", "application/vnd.pgrst.object+json");
         }
 
+        if let Some(method) = self.count {
+            request = request.header("Prefer", format!("count={}", method.as_str()));
+        }
+
         let response = request.send().await?;
 
         if !response.status().is_success() {
@@ -1207,18 +1312,7 @@ impl QueryBuilder {
             return Err(Error::database(error_msg));
         }
 
-        let result = if self.single {
-            let single_item: T = response.json().await?;
-            vec![single_item]
-        } else {
-            response.json().await?
-        };
-
-        info!(
-            "SELECT query executed successfully on table: {}",
-            self.table
-        );
-        Ok(result)
+        Ok(response)
     }
 
     /// Build the SELECT clause including any joins
@@ -1587,10 +1681,23 @@ impl TransactionBuilder {
     }
 }
 
+/// Extract the total from a PostgREST `Content-Range` header (e.g. `0-9/1234`)
+fn parse_content_range_total(value: &str) -> Option<u64> {
+    value.rsplit('/').next()?.parse().ok()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_parse_content_range_total() {
+        assert_eq!(parse_content_range_total("0-9/1234"), Some(1234));
+        assert_eq!(parse_content_range_total("*/0"), Some(0));
+        assert_eq!(parse_content_range_total("0-9/*"), None);
+        assert_eq!(parse_content_range_total("garbage"), None);
+    }
+
     #[test]
     fn test_logical_operators() {
         // Test AND operator
@@ -1679,6 +1786,32 @@ mod tests {
         assert_eq!(condition, "not.(banned.eq.true)");
     }
 
+    #[test]
+    fn test_query_params_keep_repeated_columns() {
+        use crate::types::SupabaseConfig;
+        use reqwest::Client as HttpClient;
+        use std::sync::Arc;
+
+        let config = Arc::new(SupabaseConfig::default());
+        let http_client = Arc::new(HttpClient::new());
+        let db = Database::new(config, http_client).unwrap();
+
+        let query = db
+            .from("posts")
+            .select("*")
+            .gte("created_at", "2024-01-01")
+            .lt("created_at", "2024-02-01");
+
+        let params = db.build_query_params(&query.filters);
+        assert_eq!(
+            params,
+            vec![
+                ("created_at".to_string(), "gte.2024-01-01".to_string()),
+                ("created_at".to_string(), "lt.2024-02-01".to_string()),
+            ]
+        );
+    }
+
     #[test]
     fn test_query_builder_logical_methods() {
         use crate::types::SupabaseConfig;
@@ -191,6 +191,31 @@ pub enum OrderDirection {
     Descending,
 }
 
+/// Row count strategy requested through the PostgREST `Prefer: count=...` header
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub enum CountMethod {
+    /// Exact `COUNT(*)` (full scan on large tables)
+    #[serde(rename = "exact")]
+    Exact,
+    /// Planner estimate from table statistics
+    #[serde(rename = "planned")]
+    Planned,
+    /// Exact count for small tables, planner estimate above the PostgREST threshold
+    #[serde(rename = "estimated")]
+    Estimated,
+}
+
+impl CountMethod {
+    /// Value used in the `Prefer` header
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            CountMethod::Exact => "exact",
+            CountMethod::Planned => "planned",
+            CountMethod::Estimated => "estimated",
+        }
+    }
+}
+
 /// HTTP method types
 #[derive(Debug, Clone, Copy)]
 pub enum HttpMethod {